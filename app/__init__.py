@@ -1,19 +1,25 @@
 import logging
-from flask import Flask, jsonify
+from flask import Flask
 from flask_cors import CORS
 from app.config import Config
-from app.routes.employees import employees_bp
-from app.routes.jobs import jobs_bp
-from app.routes.schedule import schedule_bp
-from app.routes.assignment import assignments_bp
+from app.utils.compression import init_compression
+from app.utils.json_provider import OrjsonProvider
 
 
 def create_app(config_class=Config):
     """
     Application factory for creating Flask app instances.
     """
+    # from_object never instantiates the class, so settings checks run here
+    if hasattr(config_class, "validate"):
+        config_class.validate()
+
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
+    # Emit keys in insertion order and without indentation, even in debug
+    app.json.sort_keys = False
+    app.json.compact = True
 
     # Configure logging
     logging.basicConfig(
@@ -22,16 +28,36 @@ def create_app(config_class=Config):
     )
 
     # Initialize extensions
-    CORS(app, resources={r"/*": {"origins": app.config["CORS_ORIGINS"]}})
+    CORS(app, origins=app.config["CORS_ORIGINS"])
+    init_compression(app)
+
+    # Register basic Flask error handlers for unhandled errors. Their bodies
+    # never change, so they are encoded once here rather than per response
+    not_found_body = app.json.response(
+        {"success": False, "error": "Resource not found"}
+    ).get_data()
+    internal_error_body = app.json.response(
+        {"success": False, "error": "Internal server error"}
+    ).get_data()
 
-    # Register basic Flask error handlers for unhandled errors
     @app.errorhandler(404)
     def handle_not_found(error):
-        return jsonify({"success": False, "error": "Resource not found"}), 404
+        return app.response_class(
+            not_found_body, status=404, mimetype=app.json.mimetype
+        )
 
     @app.errorhandler(500)
     def handle_internal_error(error):
-        return jsonify({"success": False, "error": "Internal server error"}), 500
+        return app.response_class(
+            internal_error_body, status=500, mimetype=app.json.mimetype
+        )
+
+    # Import blueprints here so the route/service/model graph is only loaded
+    # when an application is actually built.
+    from app.routes.employees import employees_bp
+    from app.routes.jobs import jobs_bp
+    from app.routes.schedule import schedule_bp
+    from app.routes.assignment import assignments_bp
 
     app.register_blueprint(employees_bp, url_prefix="/employees")
     app.register_blueprint(jobs_bp, url_prefix="/jobs")
@@ -14,7 +14,7 @@ class Config:
     DEBUG = os.environ.get("FLASK_DEBUG", "False").lower() == "true"
 
     # CORS settings
-    CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*").split(",")
+    CORS_ORIGINS = tuple(os.environ.get("CORS_ORIGINS", "*").split(","))
 
     # Data directory
     BASE_DIR = Path(__file__).resolve().parent.parent
@@ -25,11 +25,26 @@ class Config:
     JOBS_FILE = DATA_DIR / "jobs.json"
     SCHEDULE_FILE = DATA_DIR / "schedule.json"
 
+    # Seconds a cached data file is trusted before it is re-stat()ed. Writes
+    # made by this app are seen immediately; this only delays noticing files
+    # edited by something else. 0 checks on every read.
+    DATA_STAT_INTERVAL = float(os.environ.get("DATA_STAT_INTERVAL", "0"))
+
+    # Indent data files for readability; compact output is smaller and
+    # faster to write
+    DATA_PRETTY_JSON = DEBUG
+
+    # gzip JSON responses of at least COMPRESS_MIN_SIZE bytes for clients
+    # that accept it; level 4 keeps most of the size win for little CPU
+    COMPRESS_LEVEL = int(os.environ.get("COMPRESS_LEVEL", "4"))
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
 
     DEBUG = True
+    DATA_PRETTY_JSON = True
 
 
 class ProductionConfig(Config):
@@ -37,8 +52,10 @@ class ProductionConfig(Config):
 
     DEBUG = False
 
-    def __init__(self):
-        if self.SECRET_KEY == "dev-secret-key-change-in-production":
+    @classmethod
+    def validate(cls) -> None:
+        """Fail fast at boot if production settings are unsafe."""
+        if cls.SECRET_KEY == "dev-secret-key-change-in-production":
             raise ValueError("SECRET_KEY must be set in production")
 
 
@@ -47,6 +64,7 @@ class TestingConfig(Config):
 
     TESTING = True
     DEBUG = True
+    DATA_PRETTY_JSON = True
 
 
 config_by_name = {
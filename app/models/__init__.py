@@ -1,42 +1,67 @@
-from app.models.employee import Employee
-from app.models.job import Job
-from app.models.assignment import (
-    Assignment,
-    AssignmentWithDetails,
-    EmployeeBasic,
-    JobBasic,
-)
-from app.models.requests import (
-    AssignmentCreateRequest,
-    EmployeeCreateRequest,
-    JobCreateRequest,
-)
-from app.models.responses import (
-    SuccessResponse,
-    ErrorResponse,
-    ValidationErrorResponse,
-    ValidationErrorDetail,
-    TimeConflictResponse,
-    ConflictDetail,
-)
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.employee import Employee
+    from app.models.job import Job
+    from app.models.assignment import (
+        Assignment,
+        AssignmentWithDetails,
+        EmployeeBasic,
+        JobBasic,
+    )
+    from app.models.requests import (
+        AssignmentCreateRequest,
+        AssignmentBatchCreateRequest,
+        EmployeeCreateRequest,
+        JobCreateRequest,
+    )
+    from app.models.responses import (
+        SuccessResponse,
+        ErrorResponse,
+        ValidationErrorResponse,
+        ValidationErrorDetail,
+        TimeConflictResponse,
+        ConflictDetail,
+    )
+
+# Public name -> module that defines it. Submodules are imported on first
+# attribute access so consumers only pay for the models they use.
+_LAZY = {
     # Core models
-    "Employee",
-    "Job",
-    "Assignment",
-    "AssignmentWithDetails",
-    "EmployeeBasic",
-    "JobBasic",
+    "Employee": "app.models.employee",
+    "Job": "app.models.job",
+    "Assignment": "app.models.assignment",
+    "AssignmentWithDetails": "app.models.assignment",
+    "EmployeeBasic": "app.models.assignment",
+    "JobBasic": "app.models.assignment",
     # Request models
-    "AssignmentCreateRequest",
-    "EmployeeCreateRequest",
-    "JobCreateRequest",
+    "AssignmentCreateRequest": "app.models.requests",
+    "AssignmentBatchCreateRequest": "app.models.requests",
+    "EmployeeCreateRequest": "app.models.requests",
+    "JobCreateRequest": "app.models.requests",
     # Response models
-    "SuccessResponse",
-    "ErrorResponse",
-    "ValidationErrorResponse",
-    "ValidationErrorDetail",
-    "TimeConflictResponse",
-    "ConflictDetail",
-]
+    "SuccessResponse": "app.models.responses",
+    "ErrorResponse": "app.models.responses",
+    "ValidationErrorResponse": "app.models.responses",
+    "ValidationErrorDetail": "app.models.responses",
+    "TimeConflictResponse": "app.models.responses",
+    "ConflictDetail": "app.models.responses",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the attribute."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
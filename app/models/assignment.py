@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
+from secrets import token_hex
 
 
 class Assignment(BaseModel):
@@ -9,8 +10,12 @@ class Assignment(BaseModel):
     Assignment model linking employees to jobs with timestamp tracking.
     """
 
+    # Frozen: the repositories cache and share instances between requests,
+    # along with their stored JSON rows
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     id: str = Field(
-        default_factory=lambda: f"ASSIGN{uuid4().hex[:8].upper()}",
+        default_factory=lambda: f"ASSIGN{token_hex(4).upper()}",
         description="Unique assignment identifier",
     )
     employeeId: str = Field(
@@ -21,17 +26,6 @@ class Assignment(BaseModel):
         default_factory=datetime.now, description="Timestamp of assignment creation"
     )
 
-    @field_validator("employeeId", "jobId")
-    @classmethod
-    def validate_ids(cls, v: str) -> str:
-        """Ensure IDs are not empty."""
-        if not v.strip():
-            raise ValueError("ID cannot be empty or only whitespace")
-        return v.strip()
-
-    class Config:
-        validate_assignment = True
-
 
 class AssignmentWithDetails(BaseModel):
     """
@@ -47,18 +41,29 @@ class AssignmentWithDetails(BaseModel):
     job: Optional["JobBasic"] = None
 
 
-class EmployeeBasic(BaseModel):
+@dataclass(frozen=True)
+class EmployeeBasic:
     """Basic employee info for nested responses."""
 
+    __slots__ = ("id", "name", "role")
+
     id: str
     name: str
     role: str
 
 
-class JobBasic(BaseModel):
+@dataclass(frozen=True)
+class JobBasic:
     """Basic job info for nested responses."""
 
+    __slots__ = ("id", "name", "startTime", "endTime")
+
     id: str
     name: str
     startTime: datetime
     endTime: datetime
+
+
+# Resolve the forward references to EmployeeBasic/JobBasic once at import
+# instead of on first use.
+AssignmentWithDetails.model_rebuild()
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Literal
-from uuid import uuid4
+from secrets import token_hex
 
 
 class Employee(BaseModel):
@@ -8,8 +8,12 @@ class Employee(BaseModel):
     Employee model with role-based validation and availability tracking.
     """
 
+    # Frozen: the repositories cache and share instances between requests,
+    # along with their stored JSON rows
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     id: str = Field(
-        default_factory=lambda: f"EMP{uuid4().hex[:8].upper()}",
+        default_factory=lambda: f"EMP{token_hex(4).upper()}",
         description="Unique employee identifier",
     )
     name: str = Field(
@@ -26,26 +30,21 @@ class Employee(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Ensure name contains only valid characters and is properly formatted."""
-        if not v.strip():
-            raise ValueError("Name cannot be empty or only whitespace")
-
         # Remove extra spaces
         cleaned = " ".join(v.split())
 
-        # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not all(c.isalpha() or c in " -'" for c in cleaned):
+        # Check for valid characters (letters, spaces, hyphens, apostrophes):
+        # drop the separators and let str.isalpha scan the rest in C
+        letters = cleaned.replace(" ", "").replace("-", "").replace("'", "")
+        if letters and not letters.isalpha():
             raise ValueError("Name contains invalid characters")
 
         return cleaned
 
-    class Config:
-        # Allow validation on assignment
-        validate_assignment = True
-
-    def mark_unavailable(self) -> None:
-        """Mark employee as unavailable."""
-        self.availability = False
+    def as_unavailable(self) -> "Employee":
+        """Return a copy of the employee marked as unavailable."""
+        return self.model_copy(update={"availability": False})
 
-    def mark_available(self) -> None:
-        """Mark employee as available."""
-        self.availability = True
+    def as_available(self) -> "Employee":
+        """Return a copy of the employee marked as available."""
+        return self.model_copy(update={"availability": True})
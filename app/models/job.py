@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from datetime import datetime
-from uuid import uuid4
+from secrets import token_hex
 
 
 class Job(BaseModel):
@@ -8,8 +8,12 @@ class Job(BaseModel):
     Job model with time validation and conflict detection support.
     """
 
+    # Frozen: the repositories cache and share instances between requests,
+    # along with their stored JSON rows
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     id: str = Field(
-        default_factory=lambda: f"JOB{uuid4().hex[:8].upper()}",
+        default_factory=lambda: f"JOB{token_hex(4).upper()}",
         description="Unique job identifier",
     )
     name: str = Field(
@@ -18,14 +22,6 @@ class Job(BaseModel):
     startTime: datetime = Field(..., description="Job start time in ISO 8601 format")
     endTime: datetime = Field(..., description="Job end time in ISO 8601 format")
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure job name is properly formatted."""
-        if not v.strip():
-            raise ValueError("Job name cannot be empty or only whitespace")
-        return v.strip()
-
     @model_validator(mode="after")
     def validate_time_range(self) -> "Job":
         """Ensure end time is after start time and duration is reasonable."""
@@ -43,9 +39,6 @@ class Job(BaseModel):
 
         return self
 
-    class Config:
-        validate_assignment = True
-
     def get_duration_hours(self) -> float:
         """Calculate job duration in hours."""
         return (self.endTime - self.startTime).total_seconds() / 3600
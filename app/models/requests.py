@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -13,6 +13,15 @@ class AssignmentCreateRequest(BaseModel):
     jobId: str = Field(..., min_length=1, description="ID of job to assign to")
 
 
+class AssignmentBatchCreateRequest(BaseModel):
+    """
+    Request model for creating several assignments at once.
+    Used to validate incoming POST /assign/batch requests.
+    """
+
+    assignments: List[AssignmentCreateRequest] = Field(..., min_length=1)
+
+
 class EmployeeCreateRequest(BaseModel):
     """Request model for creating a new employee."""
 
@@ -28,3 +37,16 @@ class JobCreateRequest(BaseModel):
     startTime: datetime = Field(..., description="ISO 8601 datetime string")
     endTime: datetime = Field(..., description="ISO 8601 datetime string")
     description: Optional[str] = Field(default=None, max_length=500)
+
+
+# Prebuilt adapters so routes can parse and validate a raw JSON body in one
+# pydantic-core pass: ADAPTERS[Model].validate_json(request.get_data())
+ADAPTERS = {
+    cls: TypeAdapter(cls)
+    for cls in (
+        AssignmentCreateRequest,
+        AssignmentBatchCreateRequest,
+        EmployeeCreateRequest,
+        JobCreateRequest,
+    )
+}
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 
@@ -19,6 +20,7 @@ class SuccessResponse(BaseResponse):
     count: Optional[int] = None
     message: Optional[str] = None
     data: Optional[Any] = None
+    nextCursor: Optional[str] = None
 
 
 class ErrorResponse(BaseResponse):
@@ -33,9 +35,12 @@ class ErrorResponse(BaseResponse):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
-class ValidationErrorDetail(BaseModel):
+@dataclass(frozen=True)
+class ValidationErrorDetail:
     """Individual validation error detail."""
 
+    __slots__ = ("field", "message", "type")
+
     field: str
     message: str
     type: str
@@ -51,9 +56,12 @@ class ValidationErrorResponse(BaseResponse):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
-class ConflictDetail(BaseModel):
+@dataclass(frozen=True)
+class ConflictDetail:
     """Details about a scheduling conflict."""
 
+    __slots__ = ("assignmentId", "jobId", "jobName", "startTime", "endTime")
+
     assignmentId: str
     jobId: str
     jobName: str
@@ -4,91 +4,122 @@ Assignment repository for data access operations.
 Handles all assignment/schedule-related database/file I/O operations.
 """
 
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
-from flask import current_app
+from pydantic import TypeAdapter
 
 from app.models import Assignment
-from app.services.data_service import read_json_file, write_json_file
+from app.repositories.base import FileRepository, Row, Snapshot
+
+
+class _AssignmentSnapshot(Snapshot[Assignment]):
+    """
+    Assignments indexed by id, employee, job and employee-job pair, plus a
+    most-recent-first ordering that writes carry forward when they can.
+    """
+
+    __slots__ = ("by_employee", "by_job", "pairs", "_newest_first")
+
+    def __init__(
+        self,
+        items: Tuple[Assignment, ...],
+        rows: Optional[Tuple[Row, ...]] = None,
+        newest_first: Optional[Tuple[Assignment, ...]] = None,
+    ):
+        super().__init__(items, rows)
+        self._newest_first = newest_first
+        by_employee: Dict[str, List[Assignment]] = {}
+        by_job: Dict[str, List[Assignment]] = {}
+        for a in items:
+            by_employee.setdefault(a.employeeId, []).append(a)
+            by_job.setdefault(a.jobId, []).append(a)
+        self.by_employee = {k: tuple(v) for k, v in by_employee.items()}
+        self.by_job = {k: tuple(v) for k, v in by_job.items()}
+        self.pairs = frozenset((a.employeeId, a.jobId) for a in items)
+
+    def newest_first(self) -> Tuple[Assignment, ...]:
+        """
+        The assignments by assignedAt, most recent first; ties keep file
+        order. Sorted on first use unless the write that made this snapshot
+        already supplied it.
+        """
+        if self._newest_first is None:
+            self._newest_first = tuple(
+                sorted(self.items, key=attrgetter("assignedAt"), reverse=True)
+            )
+        return self._newest_first
+
 
+class AssignmentRepository(FileRepository[Assignment]):
 
-class AssignmentRepository:
+    FILE_KEY = "SCHEDULE_FILE"
+    ROWS = TypeAdapter(List[Assignment])
+    SNAPSHOT = _AssignmentSnapshot
 
-    def get_all(self) -> List[Assignment]:
+    def get_all_newest_first(self) -> Tuple[Assignment, ...]:
         """
-        Load all assignments from the data store.
+        All assignments, most recently assigned first, as a shared tuple.
         """
-        data = read_json_file(current_app.config["SCHEDULE_FILE"])
-        if data is None:
-            return []
-        return [Assignment(**item) for item in data]
-
-    def get_by_id(self, assignment_id: str) -> Optional[Assignment]:
-        assignments = self.get_all()
-        return next((a for a in assignments if a.id == assignment_id), None)
+        return self._snapshot().newest_first()
 
     def get_by_employee_id(self, employee_id: str) -> Optional[Assignment]:
-        assignments = self.get_all()
-        return next((a for a in assignments if a.employeeId == employee_id), None)
+        matches = self._snapshot().by_employee.get(employee_id)
+        return matches[0] if matches else None
 
     def get_all_by_employee_id(self, employee_id: str) -> List[Assignment]:
-        assignments = self.get_all()
-        return [a for a in assignments if a.employeeId == employee_id]
+        return list(self._snapshot().by_employee.get(employee_id, ()))
 
     def get_by_job_id(self, job_id: str) -> List[Assignment]:
         """
         Get all assignments for a specific job.
         """
-        assignments = self.get_all()
-        return [a for a in assignments if a.jobId == job_id]
-
-    def save_all(self, assignments: List[Assignment]) -> None:
-        """
-        Save all assignments to the data store.
-        """
-        data = [a.model_dump(mode="json") for a in assignments]
-        write_json_file(current_app.config["SCHEDULE_FILE"], data)
+        return list(self._snapshot().by_job.get(job_id, ()))
 
     def create(self, assignment: Assignment) -> Assignment:
         """
         Create a new assignment.
         """
-        assignments = self.get_all()
-        assignments.append(assignment)
-        self.save_all(assignments)
+        with self.locked():
+            snapshot = self._snapshot()
+
+            # A new assignment is normally the most recent one, so the
+            # existing ordering is extended rather than re-sorted on the
+            # next read
+            newest_first = snapshot._newest_first
+            if newest_first is not None and (
+                not newest_first or assignment.assignedAt > newest_first[0].assignedAt
+            ):
+                newest_first = (assignment,) + newest_first
+            else:
+                newest_first = None
+
+            self._save(
+                snapshot.items + (assignment,),
+                snapshot.rows() + (assignment.model_dump(mode="json"),),
+                newest_first,
+            )
         return assignment
 
-    def update(self, assignment: Assignment) -> Optional[Assignment]:
-        """
-        Update an existing assignment.
-
-        """
-        assignments = self.get_all()
-        for i, a in enumerate(assignments):
-            if a.id == assignment.id:
-                assignments[i] = assignment
-                self.save_all(assignments)
-                return assignment
-        return None
-
     def delete(self, assignment_id: str) -> bool:
         """
         Delete an assignment by ID.
         """
-        assignments = self.get_all()
-        original_count = len(assignments)
-        assignments = [a for a in assignments if a.id != assignment_id]
+        with self.locked():
+            snapshot = self._snapshot()
+            remaining = self._without(snapshot, assignment_id)
+            if remaining is None:
+                return False
+
+            newest_first = snapshot._newest_first
+            if newest_first is not None:
+                newest_first = tuple(a for a in newest_first if a.id != assignment_id)
 
-        if len(assignments) < original_count:
-            self.save_all(assignments)
-            return True
-        return False
+            self._save(*remaining, newest_first)
+        return True
 
     def exists(self, employee_id: str, job_id: str) -> bool:
         """
         Check if an assignment already exists for an employee-job pair.
         """
-        assignments = self.get_all()
-        return any(
-            a.employeeId == employee_id and a.jobId == job_id for a in assignments
-        )
+        return (employee_id, job_id) in self._snapshot().pairs
@@ -0,0 +1,257 @@
+"""
+Shared helpers for the file-backed repositories.
+"""
+
+from typing import (
+    Any,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from flask import current_app
+from pydantic import TypeAdapter
+
+from app.services.data_service import (
+    file_version,
+    locked,
+    read_cached,
+    write_cached,
+)
+
+M = TypeVar("M")
+
+Row = Dict[str, Any]
+
+
+class Snapshot(Generic[M]):
+    """
+    One parsed version of a data file, indexed by id.
+
+    Snapshots are cached by ``read_cached`` and shared between callers, so
+    they must never be mutated in place. The models are frozen, so an item
+    from a snapshot always matches its stored row.
+    """
+
+    __slots__ = ("items", "by_id", "positions", "has_duplicates", "_rows")
+
+    def __init__(self, items: Tuple[M, ...], rows: Optional[Tuple[Row, ...]] = None):
+        self.items = items
+        # A repeated id resolves to its first row, as a front-to-back scan
+        # of the file would
+        positions: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            positions.setdefault(item.id, i)
+        self.positions = positions
+        self.by_id: Dict[str, M] = {id_: items[i] for id_, i in positions.items()}
+        self.has_duplicates = len(positions) != len(items)
+        self._rows = rows
+
+    def rows(self) -> Tuple[Row, ...]:
+        """
+        The JSON-ready form of ``items``, position for position.
+
+        Dumped on first use after a load and then carried over to each
+        snapshot a mutation produces, so saves only dump the changed row.
+        """
+        if self._rows is None:
+            self._rows = tuple(item.model_dump(mode="json") for item in self.items)
+        return self._rows
+
+    def rows_by_ids(self, ids: Iterable[str]) -> Dict[str, Row]:
+        """
+        The stored rows of the items with the given IDs, keyed by ID.
+        Unknown IDs are left out.
+        """
+        rows = self.rows()
+        positions = self.positions
+        return {id_: rows[positions[id_]] for id_ in ids if id_ in positions}
+
+    def dump(self, item: M) -> Row:
+        """
+        The JSON-ready form of ``item``: its stored row if the item came from
+        this snapshot, otherwise a fresh ``model_dump``.
+        """
+        index = self.positions.get(item.id)
+        if index is not None and self.items[index] is item:
+            return self.rows()[index]
+        return item.model_dump(mode="json")
+
+
+class FileRepository(Generic[M]):
+    """
+    Data access for one JSON data file holding a list of models.
+
+    Subclasses set ``FILE_KEY``, the config key of their data file, ``ROWS``,
+    a TypeAdapter for a list of their model, and optionally ``SNAPSHOT``.
+    The file, DATA_STAT_INTERVAL and DATA_PRETTY_JSON are read from the
+    current app's config, so one shared instance serves every app.
+    """
+
+    FILE_KEY: ClassVar[str]
+    ROWS: ClassVar[TypeAdapter]
+    SNAPSHOT: ClassVar[Type[Snapshot]] = Snapshot
+
+    @classmethod
+    def _parse(cls, data: Optional[List[Dict[str, Any]]]) -> Snapshot[M]:
+        # Validates whole files in a single pydantic-core call
+        if not data:
+            return cls.SNAPSHOT(())
+        return cls.SNAPSHOT(tuple(cls.ROWS.validate_python(data)))
+
+    def _snapshot(self) -> Snapshot[M]:
+        config = current_app.config
+        return read_cached(
+            config[self.FILE_KEY], self._parse, config["DATA_STAT_INTERVAL"]
+        )
+
+    def _save(self, items: Tuple[M, ...], rows: Tuple[Row, ...], *extra: Any) -> None:
+        """
+        Write ``rows`` and cache them, with ``items``, as the file's snapshot.
+        ``extra`` goes to the snapshot class after them.
+        """
+        config = current_app.config
+        write_cached(
+            config[self.FILE_KEY],
+            list(rows),
+            self.SNAPSHOT(items, rows, *extra),
+            config["DATA_PRETTY_JSON"],
+        )
+
+    def locked(self) -> ContextManager[None]:
+        """
+        Hold the data file's lock for the block. Wrap reads whose results
+        decide a write, so no other thread's write lands in between.
+        """
+        return locked(current_app.config[self.FILE_KEY])
+
+    def get_all(self) -> List[M]:
+        """
+        Load all records from the data store.
+        """
+        return list(self._snapshot().items)
+
+    def get_all_shared(self) -> Tuple[M, ...]:
+        """
+        All records as the cached tuple itself, without copying it into a
+        new list. Shared between callers, so do not mutate the models.
+        """
+        return self._snapshot().items
+
+    def version(self) -> str:
+        """
+        Version token of the data file as currently served; changes with
+        every write.
+        """
+        config = current_app.config
+        return file_version(config[self.FILE_KEY], config["DATA_STAT_INTERVAL"])
+
+    def get_by_id(self, record_id: str) -> Optional[M]:
+        """
+        Get a single record by ID.
+        """
+        return self._snapshot().by_id.get(record_id)
+
+    def get_many_by_ids(self, record_ids: Iterable[str]) -> Dict[str, M]:
+        """
+        Get the records with the given IDs, keyed by ID. Unknown IDs are
+        left out.
+        """
+        by_id = self._snapshot().by_id
+        return {id_: by_id[id_] for id_ in record_ids if id_ in by_id}
+
+    def to_rows(self, records: Sequence[M]) -> List[Row]:
+        """
+        JSON-ready dicts for records, reusing the stored dump of each one read
+        from the data store. The dicts are shared and must not be modified.
+        """
+        snapshot = self._snapshot()
+        return [snapshot.dump(record) for record in records]
+
+    def get_rows_by_ids(self, record_ids: Iterable[str]) -> Dict[str, Row]:
+        """
+        Stored JSON-ready dicts of the records with the given IDs, keyed by
+        ID. The dicts are shared and must not be modified.
+        """
+        return self._snapshot().rows_by_ids(record_ids)
+
+    def save_all(self, records: List[M]) -> None:
+        """
+        Save all records to the data store.
+        """
+        rows = tuple(self.ROWS.dump_python(records, mode="json"))
+        self._save(tuple(records), rows)
+
+    def create(self, record: M) -> M:
+        """
+        Create a new record.
+        """
+        with self.locked():
+            snapshot = self._snapshot()
+            self._save(
+                snapshot.items + (record,),
+                snapshot.rows() + (record.model_dump(mode="json"),),
+            )
+        return record
+
+    def update(self, record: M) -> Optional[M]:
+        """
+        Update an existing record.
+        """
+        with self.locked():
+            snapshot = self._snapshot()
+            index = snapshot.positions.get(record.id)
+            if index is None:
+                return None
+
+            items = list(snapshot.items)
+            rows = list(snapshot.rows())
+            items[index] = record
+            rows[index] = record.model_dump(mode="json")
+            self._save(tuple(items), tuple(rows))
+        return record
+
+    def _without(
+        self, snapshot: Snapshot[M], record_id: str
+    ) -> Optional[Tuple[Tuple[M, ...], Tuple[Row, ...]]]:
+        """
+        The items and rows of ``snapshot`` minus every record with
+        ``record_id``, or None if there is no such record.
+        """
+        index = snapshot.positions.get(record_id)
+        if index is None:
+            return None
+
+        if snapshot.has_duplicates:
+            kept = [
+                (item, row)
+                for item, row in zip(snapshot.items, snapshot.rows())
+                if item.id != record_id
+            ]
+            return tuple(item for item, _ in kept), tuple(row for _, row in kept)
+
+        items = list(snapshot.items)
+        rows = list(snapshot.rows())
+        del items[index]
+        del rows[index]
+        return tuple(items), tuple(rows)
+
+    def delete(self, record_id: str) -> bool:
+        """
+        Delete a record by ID, along with any duplicates of it.
+        """
+        with self.locked():
+            remaining = self._without(self._snapshot(), record_id)
+            if remaining is None:
+                return False
+
+            self._save(*remaining)
+        return True
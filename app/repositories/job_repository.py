@@ -1,66 +1,41 @@
-from typing import List, Optional
+from bisect import bisect_right
+from datetime import datetime
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
-from flask import current_app
+from pydantic import TypeAdapter
 
 from app.models import Job
-from app.services.data_service import read_json_file, write_json_file
+from app.repositories.base import FileRepository, Row, Snapshot
 
 
-class JobRepository:
-    """Repository for job data access operations."""
+class _JobSnapshot(Snapshot[Job]):
+    """Jobs indexed by id, plus a start-time ordering built on first use."""
 
-    def get_all(self) -> List[Job]:
-        """
-        Load all jobs from the data store.
-        """
-        data = read_json_file(current_app.config["JOBS_FILE"])
-        return [Job(**job) for job in data]
+    __slots__ = ("_by_start",)
 
-    def get_by_id(self, job_id: str) -> Optional[Job]:
-        """
-        Get a single job by ID.
+    def __init__(self, items: Tuple[Job, ...], rows: Optional[Tuple[Row, ...]] = None):
+        super().__init__(items, rows)
+        self._by_start: Optional[Tuple[Tuple[Job, ...], List[datetime]]] = None
 
-        """
-        jobs = self.get_all()
-        return next((j for j in jobs if j.id == job_id), None)
+    def by_start(self) -> Tuple[Tuple[Job, ...], List[datetime]]:
+        """The jobs sorted by start time, and their start times in that order."""
+        if self._by_start is None:
+            jobs = tuple(sorted(self.items, key=attrgetter("startTime")))
+            self._by_start = (jobs, [job.startTime for job in jobs])
+        return self._by_start
 
-    def save_all(self, jobs: List[Job]) -> None:
-        """
-        Save all jobs to the data store.
-        """
-        data = [job.model_dump(mode="json") for job in jobs]
-        write_json_file(current_app.config["JOBS_FILE"], data)
 
-    def create(self, job: Job) -> Job:
-        """
-        Create a new job.
-        """
-        jobs = self.get_all()
-        jobs.append(job)
-        self.save_all(jobs)
-        return job
+class JobRepository(FileRepository[Job]):
+    """Repository for job data access operations."""
 
-    def update(self, job: Job) -> Optional[Job]:
-        """
-        Update an existing job.
-        """
-        jobs = self.get_all()
-        for i, j in enumerate(jobs):
-            if j.id == job.id:
-                jobs[i] = job
-                self.save_all(jobs)
-                return job
-        return None
+    FILE_KEY = "JOBS_FILE"
+    ROWS = TypeAdapter(List[Job])
+    SNAPSHOT = _JobSnapshot
 
-    def delete(self, job_id: str) -> bool:
+    def get_starting_after(self, moment: datetime) -> List[Job]:
         """
-        Delete a job by ID.
+        Get the jobs that start after ``moment``, soonest first.
         """
-        jobs = self.get_all()
-        original_count = len(jobs)
-        jobs = [j for j in jobs if j.id != job_id]
-
-        if len(jobs) < original_count:
-            self.save_all(jobs)
-            return True
-        return False
+        jobs, start_times = self._snapshot().by_start()
+        return list(jobs[bisect_right(start_times, moment) :])
@@ -1,12 +1,22 @@
-from flask import Blueprint, jsonify, request
+from datetime import datetime
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Blueprint, Response, request
 from pydantic import ValidationError
 from app.services.assignment_service import AssignmentService
 from app.models import (
+    AssignmentBatchCreateRequest,
     AssignmentCreateRequest,
     ErrorResponse,
     SuccessResponse,
     ValidationErrorResponse,
-    ValidationErrorDetail,
+)
+from app.models.requests import ADAPTERS
+from app.utils.responses import (
+    internal_error_response,
+    json_response,
+    service_error_response,
 )
 
 assignments_bp = Blueprint("assign", __name__)
@@ -14,6 +24,56 @@ assignments_bp = Blueprint("assign", __name__)
 
 assignment_service = AssignmentService()
 
+# Fixed parts of the 400 payloads, dumped once from their models; handlers
+# only add the per-request fields
+_EMPTY_BODY_ERROR = ErrorResponse(
+    error="InvalidRequest", message="Request body is required"
+).model_dump(exclude={"timestamp"})
+_VALIDATION_ERROR = ValidationErrorResponse(errors=[]).model_dump(
+    exclude={"errors", "timestamp"}
+)
+
+# Success envelopes, likewise dumped once; handlers only add "data"
+_CREATED = SuccessResponse(message="Assignment created successfully").model_dump()
+_DELETED = SuccessResponse(message="Assignment deleted successfully").model_dump()
+_BATCH_PROCESSED = SuccessResponse(message="Assignment batch processed").model_dump()
+
+
+def _validation_error_response(errors: List[Dict[str, str]]) -> Response:
+    """Render a ValidationErrorResponse from already-built error details."""
+    error_response = {
+        **_VALIDATION_ERROR,
+        "errors": errors,
+        "timestamp": datetime.now(),
+    }
+    return json_response(error_response, 400)
+
+
+def _parse_body(model: type) -> Tuple[Optional[Any], Optional[Response]]:
+    """
+    Parse and validate the raw request body against a request model.
+    """
+    raw_body = request.get_data(cache=False)
+
+    if not raw_body:
+        error_response = {**_EMPTY_BODY_ERROR, "timestamp": datetime.now()}
+        return None, json_response(error_response, 400)
+
+    # Parse and validate with Pydantic in a single pass
+    try:
+        return ADAPTERS[model].validate_json(raw_body), None
+    except ValidationError as e:
+        # Same shape as ValidationErrorDetail, built as plain dicts
+        validation_errors = [
+            {
+                "field": ".".join(map(str, error["loc"])),
+                "message": error["msg"],
+                "type": error["type"],
+            }
+            for error in e.errors(include_url=False)
+        ]
+        return None, _validation_error_response(validation_errors)
+
 
 @assignments_bp.route("", methods=["POST"])
 def create_assignment():
@@ -22,30 +82,9 @@ def create_assignment():
     """
     try:
         # Get and validate request data
-        request_data = request.get_json()
-
-        if not request_data:
-            error_response = ErrorResponse(
-                error="InvalidRequest", message="Request body is required"
-            )
-            return jsonify(error_response.model_dump()), 400
-
-        # Validate with Pydantic
-        try:
-            validated_request = AssignmentCreateRequest(**request_data)
-        except ValidationError as e:
-            # Handle Pydantic validation errors
-            validation_errors = []
-            for error in e.errors():
-                validation_errors.append(
-                    ValidationErrorDetail(
-                        field=".".join(str(loc) for loc in error["loc"]),
-                        message=error["msg"],
-                        type=error["type"],
-                    )
-                )
-            error_response = ValidationErrorResponse(errors=validation_errors)
-            return jsonify(error_response.model_dump()), 400
+        validated_request, error_response = _parse_body(AssignmentCreateRequest)
+        if error_response:
+            return error_response
 
         # Create assignment through service (enforces all business rules)
         assignment, error = assignment_service.create_assignment(
@@ -55,27 +94,53 @@ def create_assignment():
 
         # Handle service errors
         if error:
-            error_response = ErrorResponse(
-                error=error.get("error_type", "Internal Server Error"),
-                message=error["message"],
-                details=error.get("details"),
-            )
-            return jsonify(error_response.model_dump()), error["status_code"]
+            return service_error_response(error)
 
         # Return success response
-        response = SuccessResponse(
-            message="Assignment created successfully", data=assignment.model_dump()
-        )
+        response = {**_CREATED, "data": assignment.model_dump()}
 
-        return jsonify(response.model_dump()), 201
+        return json_response(response, 201)
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to create assignment",
-            details={"error": str(e)},
+        return internal_error_response("Failed to create assignment", e)
+
+
+@assignments_bp.route("/batch", methods=["POST"])
+def create_assignments_batch():
+    """
+    Create several assignments and write the JSON file once.
+
+    Items are processed in order, each checked against the ones before it.
+    The response lists one result per item with its own status code.
+    """
+    try:
+        validated_request, error_response = _parse_body(AssignmentBatchCreateRequest)
+        if error_response:
+            return error_response
+
+        outcomes = assignment_service.create_assignments(
+            [(item.employeeId, item.jobId) for item in validated_request.assignments]
         )
-        return jsonify(error_response.model_dump()), 500
+
+        results = []
+        for assignment, error in outcomes:
+            if error:
+                results.append(
+                    {
+                        "status": error["status_code"],
+                        "error": error["error_type"],
+                        "message": error["message"],
+                    }
+                )
+            else:
+                results.append({"status": 201, "data": assignment.model_dump()})
+
+        response = {**_BATCH_PROCESSED, "count": len(results), "data": results}
+
+        return json_response(response, 200)
+
+    except Exception as e:
+        return internal_error_response("Failed to create assignments", e)
 
 
 @assignments_bp.route("/<assignment_id>", methods=["DELETE"])
@@ -89,22 +154,12 @@ def delete_assignment(assignment_id: str):
 
         # Handle service errors
         if error:
-            error_response = ErrorResponse(
-                error=error["error_type"], message=error["message"]
-            )
-            return jsonify(error_response.model_dump()), error["status_code"]
+            return service_error_response(error)
 
         # Return success response
-        response = SuccessResponse(
-            message="Assignment deleted successfully", data={"deletedId": assignment_id}
-        )
+        response = {**_DELETED, "data": {"deletedId": assignment_id}}
 
-        return jsonify(response.model_dump()), 200
+        return json_response(response, 200)
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to delete assignment",
-            details={"error": str(e)},
-        )
-        return jsonify(error_response.model_dump()), 500
+        return internal_error_response("Failed to delete assignment", e)
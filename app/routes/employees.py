@@ -2,10 +2,16 @@
 Employee API routes.
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from app.models import SuccessResponse, ErrorResponse
+from app.models import SuccessResponse
 from app.services.employee_service import EmployeeService
+from app.utils.pagination import paginate
+from app.utils.responses import (
+    internal_error_response,
+    not_modified_response,
+    service_error_response,
+)
 
 # Create blueprint
 employees_bp = Blueprint("employees", __name__)
@@ -13,34 +19,41 @@ employees_bp = Blueprint("employees", __name__)
 # Initialize service
 employee_service = EmployeeService()
 
+# Success envelope dumped once; handlers only add count, data and nextCursor
+_SUCCESS = SuccessResponse().model_dump()
+
 
 @employees_bp.route("", methods=["GET"])
 def get_all_employees():
     """
-    Get all employees.
+    Get all employees, optionally one page at a time.
     """
     try:
+        # Answer polls of unchanged data before loading or serializing it
+        etag = employee_service.get_data_version()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+
         employees, error = employee_service.get_all_employees()
 
-        # Return only id, name, role, availability
-        employees_data = [
-            {
-                "id": emp.id,
-                "name": emp.name,
-                "role": emp.role,
-                "availability": emp.availability,
-            }
-            for emp in employees
-        ]
+        page, error = paginate(
+            employees, request.args.get("limit"), request.args.get("cursor")
+        )
+        if error:
+            return service_error_response(error)
+        employees, next_cursor = page
 
-        response = SuccessResponse(count=len(employees_data), data=employees_data)
+        # id, name, role and availability: the stored rows hold exactly these
+        employees_data = employee_service.dump_employees(employees)
 
-        return jsonify(response.model_dump()), 200
+        response = {**_SUCCESS, "count": len(employees_data), "data": employees_data}
+        if next_cursor:
+            response["nextCursor"] = next_cursor
+
+        result = jsonify(response)
+        result.set_etag(etag, weak=True)
+        return result, 200
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to retrieve employees",
-            details={"error": str(e)},
-        )
-        return jsonify(error_response.model_dump()), 500
+        return internal_error_response("Failed to retrieve employees", e)
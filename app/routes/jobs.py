@@ -6,10 +6,16 @@ Handles all job-related endpoints including:
 - Get single job
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from app.models import SuccessResponse, ErrorResponse
+from app.models import SuccessResponse
 from app.services.job_service import JobService
+from app.utils.pagination import paginate
+from app.utils.responses import (
+    internal_error_response,
+    not_modified_response,
+    service_error_response,
+)
 
 # Create blueprint
 jobs_bp = Blueprint("jobs", __name__)
@@ -17,27 +23,40 @@ jobs_bp = Blueprint("jobs", __name__)
 # Initialize service
 job_service = JobService()
 
+# Success envelopes dumped once; handlers only add count, data and nextCursor
+_SUCCESS = SuccessResponse().model_dump()
+_RETRIEVED = SuccessResponse(message="Job retrieved successfully").model_dump()
+
 
 @jobs_bp.route("", methods=["GET"])
 def get_all_jobs():
-    """Get all jobs."""
+    """Get all jobs, optionally one page at a time."""
     try:
+        # Answer polls of unchanged data before loading or serializing it
+        etag = job_service.get_data_version()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+
         jobs, _ = job_service.get_all_jobs()
-        jobs_data = [job.model_dump() for job in jobs]
 
-        response = SuccessResponse(
-            count=len(jobs_data),
-            data=jobs_data,
+        page, error = paginate(
+            jobs, request.args.get("limit"), request.args.get("cursor")
         )
-        return jsonify(response.model_dump()), 200
+        if error:
+            return service_error_response(error)
+        jobs, next_cursor = page
+        jobs_data = job_service.dump_jobs(jobs)
+
+        response = {**_SUCCESS, "count": len(jobs_data), "data": jobs_data}
+        if next_cursor:
+            response["nextCursor"] = next_cursor
+        result = jsonify(response)
+        result.set_etag(etag, weak=True)
+        return result, 200
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to retrieve jobs",
-            details={"error": str(e)},
-        )
-        return jsonify(error_response.model_dump()), 500
+        return internal_error_response("Failed to retrieve jobs", e)
 
 
 @jobs_bp.route("/<job_id>", methods=["GET"])
@@ -48,19 +67,11 @@ def get_job_by_id(job_id: str):
 
         # Handle service errors
         if error:
-            error_response = ErrorResponse(
-                error=error["error_type"], message=error["message"]
-            )
-            return jsonify(error_response.model_dump()), error["status_code"]
+            return service_error_response(error)
 
-        response = SuccessResponse(message="Job retrieved successfully", data=job_data)
+        response = {**_RETRIEVED, "data": job_data}
 
-        return jsonify(response.model_dump()), 200
+        return jsonify(response), 200
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to retrieve job",
-            details={"error": str(e)},
-        )
-        return jsonify(error_response.model_dump()), 500
+        return internal_error_response("Failed to retrieve job", e)
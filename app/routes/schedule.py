@@ -1,7 +1,12 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from app.models import ErrorResponse, SuccessResponse
+from app.models import SuccessResponse
 from app.services.schedule_service import ScheduleService
+from app.utils.responses import (
+    internal_error_response,
+    not_modified_response,
+    service_error_response,
+)
 
 # Create blueprint
 schedule_bp = Blueprint("schedule", __name__)
@@ -9,29 +14,44 @@ schedule_bp = Blueprint("schedule", __name__)
 # Initialize service
 schedule_service = ScheduleService()
 
+# Success envelope dumped once; handlers only add count, data and nextCursor
+_SUCCESS = SuccessResponse().model_dump()
+
 
 @schedule_bp.route("", methods=["GET"])
 def get_schedule():
     """
-    Get the current list of assignments with full employee and job details.
+    Get the current list of assignments with full employee and job details,
+    optionally one page at a time.
     """
     try:
-        enriched_assignments = schedule_service.get_enriched_assignments()
+        # Answer polls of unchanged data before loading or serializing it
+        etag = schedule_service.get_data_version()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+
+        page, error = schedule_service.get_enriched_page(
+            request.args.get("limit"), request.args.get("cursor")
+        )
+        if error:
+            return service_error_response(error)
+        enriched_assignments, next_cursor = page
 
         # Convert to dict for JSON response
         assignments_data = [a.model_dump() for a in enriched_assignments]
 
-        response = SuccessResponse(
-            count=len(assignments_data),
-            data=assignments_data,
-        )
+        response = {
+            **_SUCCESS,
+            "count": len(assignments_data),
+            "data": assignments_data,
+        }
+        if next_cursor:
+            response["nextCursor"] = next_cursor
 
-        return jsonify(response.model_dump()), 200
+        result = jsonify(response)
+        result.set_etag(etag, weak=True)
+        return result, 200
 
     except Exception as e:
-        error_response = ErrorResponse(
-            error="InternalError",
-            message="Failed to retrieve schedule",
-            details={"error": str(e)},
-        )
-        return jsonify(error_response.model_dump()), 500
+        return internal_error_response("Failed to retrieve schedule", e)
@@ -1,9 +1,8 @@
 from app.services.employee_service import EmployeeService, get_employee_repository
 from app.services.job_service import JobService, get_job_repository
-from app.services.assignment_service import AssignmentService
+from app.services.assignment_service import AssignmentService, get_assignment_repository
 from app.services.schedule_service import (
     ScheduleService,
-    get_assignment_repository,
     validate_assignment,
     create_assignment,
     delete_assignment,
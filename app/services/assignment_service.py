@@ -1,13 +1,24 @@
 import logging
 from typing import Optional, List, Tuple, Dict, Any
-from datetime import datetime
 
 from app.models import Assignment, ConflictDetail
 from app.repositories import EmployeeRepository, JobRepository, AssignmentRepository
+from app.services.data_service import batch
+from app.services.employee_service import get_employee_repository
+from app.services.job_service import get_job_repository
 
 logger = logging.getLogger(__name__)
 
 
+# Shared repository instance
+_assignment_repo = AssignmentRepository()
+
+
+def get_assignment_repository() -> AssignmentRepository:
+    """Get the assignment repository instance."""
+    return _assignment_repo
+
+
 class AssignmentService:
     """
     Service layer for assignment business logic.
@@ -26,17 +37,11 @@ class AssignmentService:
 
 
         """
-        self.employee_repo = employee_repo or EmployeeRepository()
-        self.job_repo = job_repo or JobRepository()
-        self.assignment_repo = assignment_repo or AssignmentRepository()
+        self.employee_repo = employee_repo or get_employee_repository()
+        self.job_repo = job_repo or get_job_repository()
+        self.assignment_repo = assignment_repo or _assignment_repo
 
-    def _times_overlap(
-        self, start1: datetime, end1: datetime, start2: datetime, end2: datetime
-    ) -> bool:
-
-        return start1 < end2 and start2 < end1
-
-    def _validate_assignment(
+    def validate_assignment(
         self, employee_id: str, job_id: str
     ) -> Tuple[Optional[tuple], Optional[Dict[str, Any]]]:
 
@@ -61,8 +66,9 @@ class AssignmentService:
         # Rule 3: Check employee availability
         if not employee.availability:
             logger.warning(
-                f"Assignment rejected (Availability Filtering): "
-                f"Employee {employee.name} is unavailable"
+                "Assignment rejected (Availability Filtering): "
+                "Employee %s is unavailable",
+                employee.name,
             )
             return None, {
                 "error_type": "EmployeeUnavailable",
@@ -73,8 +79,10 @@ class AssignmentService:
         # Rule 1: Check for double booking (same employee-job pair already exists)
         if self.assignment_repo.exists(employee_id, job_id):
             logger.warning(
-                f"Assignment rejected (Double Booking): "
-                f"Employee {employee.name} already assigned to job {job.name}"
+                "Assignment rejected (Double Booking): "
+                "Employee %s already assigned to job %s",
+                employee.name,
+                job.name,
             )
             return None, {
                 "error_type": "DoubleBooking",
@@ -84,15 +92,19 @@ class AssignmentService:
 
         # Rule 2: Check for time overlap with ALL existing assignments for this employee
         existing_assignments = self.assignment_repo.get_all_by_employee_id(employee_id)
+        existing_jobs = self.job_repo.get_many_by_ids(
+            a.jobId for a in existing_assignments
+        )
 
         for existing_assignment in existing_assignments:
-            existing_job = self.job_repo.get_by_id(existing_assignment.jobId)
-            if existing_job and self._times_overlap(
-                job.startTime, job.endTime, existing_job.startTime, existing_job.endTime
-            ):
+            existing_job = existing_jobs.get(existing_assignment.jobId)
+            if existing_job and job.overlaps_with(existing_job):
                 logger.warning(
-                    f"Assignment rejected (No Overlapping Time Slots): "
-                    f"Time overlap for {employee.name} between {job.name} and {existing_job.name}"
+                    "Assignment rejected (No Overlapping Time Slots): "
+                    "Time overlap for %s between %s and %s",
+                    employee.name,
+                    job.name,
+                    existing_job.name,
                 )
                 return None, {
                     "error_type": "TimeOverlap",
@@ -100,7 +112,9 @@ class AssignmentService:
                     "status_code": 409,
                 }
 
-        logger.info(f"Validation passed for assigning {employee.name} to {job.name}")
+        logger.info(
+            "Validation passed for assigning %s to %s", employee.name, job.name
+        )
         return (employee, job), None
 
     def create_assignment(
@@ -109,28 +123,49 @@ class AssignmentService:
         job_id: str,
     ) -> Tuple[Optional[Assignment], Optional[Dict[str, Any]]]:
 
-        # Validate the assignment
-        validation_result, error = self._validate_assignment(employee_id, job_id)
-        if error:
-            return None, error
+        # Validate and save under the schedule file's lock, so no other
+        # write can land between the checks and the save
+        with self.assignment_repo.locked():
+            validation_result, error = self.validate_assignment(employee_id, job_id)
+            if error:
+                return None, error
 
-        employee, job = validation_result
+            employee, job = validation_result
 
-        # Create the assignment
-        new_assignment = Assignment(
-            employeeId=employee_id,
-            jobId=job_id,
-        )
+            # Create the assignment
+            new_assignment = Assignment(
+                employeeId=employee_id,
+                jobId=job_id,
+            )
 
-        # Save to data store
-        self.assignment_repo.create(new_assignment)
+            # Save to data store
+            self.assignment_repo.create(new_assignment)
 
         logger.info(
-            f"Created assignment {new_assignment.id}: " f"{employee.name} -> {job.name}"
+            "Created assignment %s: %s -> %s",
+            new_assignment.id,
+            employee.name,
+            job.name,
         )
 
         return new_assignment, None
 
+    def create_assignments(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Tuple[Optional[Assignment], Optional[Dict[str, Any]]]]:
+        """
+        Create several assignments from (employee_id, job_id) pairs.
+
+        Each pair is validated against the assignments created before it in
+        the same call, and the schedule file is written once at the end. Its
+        lock is held throughout, so concurrent writes wait for the flush.
+        """
+        with self.assignment_repo.locked(), batch():
+            return [
+                self.create_assignment(employee_id, job_id)
+                for employee_id, job_id in pairs
+            ]
+
     def delete_assignment(
         self, assignment_id: str
     ) -> Tuple[Optional[bool], Optional[Dict[str, Any]]]:
@@ -138,17 +173,14 @@ class AssignmentService:
         Delete an assignment.
 
         """
-        assignment = self.assignment_repo.get_by_id(assignment_id)
-        if not assignment:
+        if not self.assignment_repo.delete(assignment_id):
             return None, {
                 "error_type": "AssignmentNotFound",
                 "message": f"Assignment with id '{assignment_id}' not found",
                 "status_code": 404,
             }
 
-        self.assignment_repo.delete(assignment_id)
-
-        logger.info(f"Deleted assignment {assignment_id}")
+        logger.info("Deleted assignment %s", assignment_id)
         return True, None
 
     def get_assignment_for_employee(self, employee_id: str) -> Optional[Assignment]:
@@ -1,20 +1,106 @@
-import json
 import logging
+import mmap
+import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, List
+from threading import Lock, RLock, local
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
-# Thread locks for file operations
-_file_locks: Dict[str, Lock] = {}
+T = TypeVar("T")
+
+# Thread locks for file operations, created under _file_locks_guard so two
+# threads can never end up holding different locks for the same file.
+# Reentrant, so a thread holding one through locked() can still read and
+# write the file
+_file_locks: Dict[str, RLock] = {}
+_file_locks_guard = Lock()
+
+# Parsed file contents keyed by path, tagged with the (mtime_ns, size, inode)
+# stamp of the file they were read from and the monotonic time it was last
+# checked
+_cache: Dict[str, Tuple[Optional[Tuple[int, int, int]], Any, float]] = {}
+
+# Per-thread writes deferred by batch(), keyed by path
+_batch = local()
 
+# Files above this size are parsed straight from a read-only mapping
+# instead of being copied into a bytes object first
+_MMAP_THRESHOLD = 256 * 1024
 
-def _get_lock(file_path: str) -> Lock:
+
+def _get_lock(file_path: str) -> RLock:
     """Get or create a lock for a specific file path."""
-    if file_path not in _file_locks:
-        _file_locks[file_path] = Lock()
-    return _file_locks[file_path]
+    lock = _file_locks.get(file_path)
+    if lock is None:
+        with _file_locks_guard:
+            lock = _file_locks.setdefault(file_path, RLock())
+    return lock
+
+
+@contextmanager
+def locked(file_path: Path) -> Iterator[None]:
+    """
+    Hold a file's lock for the whole block, so a read-validate-write
+    sequence cannot interleave with another thread's reads or writes of
+    the same file.
+    """
+    with _get_lock(str(file_path)):
+        yield
+
+
+def _file_stamp(file_path: Path) -> Optional[Tuple[int, int, int]]:
+    """
+    Return (mtime_ns, size, inode) for a file, or None if it does not exist.
+
+    Every write replaces the file, so the inode changes even when a rewrite
+    keeps the size and lands within the filesystem's mtime granularity.
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def file_version(file_path: Path, max_age: float = 0.0) -> str:
+    """
+    A short token that changes whenever the file is rewritten, built from
+    the same stamp that invalidates the read cache.
+
+    ``max_age`` must be the one the file is read with. Within it the token
+    of the cached value is returned, so it matches what ``read_cached``
+    serves rather than a newer file the cache has not noticed yet.
+    """
+    cached = _cache.get(str(file_path))
+    if cached is not None and time.monotonic() - cached[2] < max_age:
+        stamp = cached[0]
+    else:
+        stamp = _file_stamp(file_path)
+    if stamp is None:
+        return "0"
+    return "-".join("%x" % part for part in stamp)
+
+
+def _load(file_path: Path) -> List[Dict[str, Any]]:
+    """Read and decode a JSON file. Callers must hold the file's lock."""
+    if not file_path.exists():
+        logger.warning("File not found: %s, returning empty list", file_path)
+        return []
+
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+        else:
+            data = orjson.loads(f.read())
+        logger.debug("Read %d records from %s", len(data), file_path)
+        return data
 
 
 def read_json_file(file_path: Path) -> List[Dict[str, Any]]:
@@ -26,26 +112,154 @@ def read_json_file(file_path: Path) -> List[Dict[str, Any]]:
     lock = _get_lock(str(file_path))
 
     with lock:
-        if not file_path.exists():
-            logger.warning(f"File not found: {file_path}, returning empty list")
-            return []
+        return _load(file_path)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            logger.debug(f"Read {len(data)} records from {file_path}")
-            return data
 
+def read_cached(
+    file_path: Path,
+    loader: Callable[[List[Dict[str, Any]]], T],
+    max_age: float = 0.0,
+) -> T:
+    """
+    Read a JSON file and build a value from it with ``loader``.
 
-def write_json_file(file_path: Path, data: List[Dict[str, Any]]) -> None:
+    The result is reused until the file's mtime, size or inode changes, so
+    repeated reads cost a single ``stat`` call. With ``max_age`` > 0 even that is
+    skipped for entries checked within the last ``max_age`` seconds, which
+    only delays noticing edits made outside this process. Each path must
+    always be read with the same loader. The cached value is shared, so
+    loaders should return immutable containers.
+    """
+    key = str(file_path)
+
+    pending = getattr(_batch, "pending", None)
+    if pending is not None and key in pending:
+        path, data, value, pretty = pending[key]
+        if value is None:
+            value = loader(data)
+            pending[key] = (path, data, value, pretty)
+        return value
+
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached is not None and now - cached[2] < max_age:
+        return cached[1]
+
+    lock = _get_lock(key)
+
+    with lock:
+        stamp = _file_stamp(file_path)
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            _cache[key] = (stamp, cached[1], now)
+            return cached[1]
+
+        value = loader(_load(file_path))
+        _cache[key] = (stamp, value, now)
+        return value
+
+
+def _dump(file_path: Path, data: List[Dict[str, Any]], pretty: bool) -> None:
+    """Encode and write a JSON file. Callers must hold the file's lock."""
+    # Ensure directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Encode to one UTF-8 buffer so the file is written in a single call
+    # rather than json.dump's many small writes
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    # Write beside the target and rename over it, so readers (and the mtime
+    # cache) only ever see the old file or the complete new one
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    logger.info("Wrote %d records to %s", len(data), file_path)
+
+
+def write_json_file(
+    file_path: Path, data: List[Dict[str, Any]], pretty: bool = True
+) -> None:
     """
     Write data to a JSON file with thread safety.
+
+    ``pretty`` indents the output by two spaces; otherwise it is compact.
     """
+    if _defer(file_path, data, None, pretty):
+        return
+
     lock = _get_lock(str(file_path))
 
     with lock:
-        # Ensure directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        _dump(file_path, data, pretty)
+        # mtime granularity can hide back-to-back writes, so never trust a
+        # cached value for a file this process has just rewritten
+        _cache.pop(str(file_path), None)
+
+
+def write_cached(
+    file_path: Path, data: List[Dict[str, Any]], value: Any, pretty: bool = True
+) -> None:
+    """
+    Write data to a JSON file and cache ``value`` as its parsed form.
+
+    ``value`` must be what the file's ``read_cached`` loader would build from
+    ``data``; the next read then skips parsing the file that was just written.
+    ``pretty`` is as for ``write_json_file``.
+    """
+    if _defer(file_path, data, value, pretty):
+        return
+
+    key = str(file_path)
+    lock = _get_lock(key)
+
+    with lock:
+        _dump(file_path, data, pretty)
+        _cache[key] = (_file_stamp(file_path), value, time.monotonic())
+
+
+def _defer(
+    file_path: Path, data: List[Dict[str, Any]], value: Any, pretty: bool
+) -> bool:
+    """Queue a write on the current batch, if any. Returns True if queued."""
+    pending = getattr(_batch, "pending", None)
+    if pending is None:
+        return False
+    pending[str(file_path)] = (file_path, data, value, pretty)
+    return True
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Defer writes made on this thread until the block exits.
+
+    Each file is written once with its last queued contents, however many
+    times it was saved inside the block. Reads on the same thread see the
+    queued data. Nothing is written if the block raises. Nested batches
+    join the outermost one.
+
+    The batch itself takes no file lock, and each flush replaces the whole
+    file. Run it inside ``locked()`` for the files it writes, entered before
+    the batch, so no other thread can write them in between and have its
+    write replaced by the flush.
+    """
+    if getattr(_batch, "pending", None) is not None:
+        yield
+        return
+
+    _batch.pending = pending = {}
+    try:
+        yield
+    finally:
+        _batch.pending = None
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Wrote {len(data)} records to {file_path}")
+    for file_path, data, value, pretty in pending.values():
+        if value is None:
+            write_json_file(file_path, data, pretty)
+        else:
+            write_cached(file_path, data, value, pretty)
@@ -1,9 +1,12 @@
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Sequence, Tuple, Dict, Any
 from app.models import Employee
 from app.repositories import EmployeeRepository
 
 
-VALID_ROLES = ["TCP", "LCT", "Supervisor"]
+# Membership checks hash instead of scanning; VALID_ROLES_DISPLAY keeps the
+# order for messages
+VALID_ROLES_DISPLAY = ("TCP", "LCT", "Supervisor")
+VALID_ROLES = frozenset(VALID_ROLES_DISPLAY)
 
 
 # Shared repository instance
@@ -25,18 +28,30 @@ class EmployeeService:
         Args:
             repository: Optional repository instance (uses default if not provided)
         """
-        self.repository = _employee_repo
+        self.repository = repository or _employee_repo
 
     def get_all_employees(
         self,
-    ) -> Tuple[Optional[List[Employee]], Optional[Dict[str, Any]]]:
+    ) -> Tuple[Optional[Sequence[Employee]], Optional[Dict[str, Any]]]:
         """
-        Get all employees.
+        Get all employees, as the repository's shared tuple.
         """
-        employees = self.repository.get_all()
+        employees = self.repository.get_all_shared()
 
         return employees, None
 
+    def get_data_version(self) -> str:
+        """
+        Version of the employee data, for conditional GETs.
+        """
+        return self.repository.version()
+
+    def dump_employees(self, employees: Sequence[Employee]) -> List[Dict[str, Any]]:
+        """
+        Serialize employees for a response, without re-dumping stored ones.
+        """
+        return self.repository.to_rows(employees)
+
     def get_employee_by_id(
         self, employee_id: str
     ) -> Tuple[Optional[Employee], Optional[Dict[str, Any]]]:
@@ -1,11 +1,15 @@
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime
+from operator import attrgetter
 
 from app.models import Job
-from app.models.validators import AssignmentValidator
+from app.models.validators import parse_datetime
 from app.repositories import JobRepository
 
 
+# Sort key for jobs; attrgetter runs in C, unlike an equivalent lambda
+_start_time = attrgetter("startTime")
+
 # Shared repository instance
 _job_repo = JobRepository()
 
@@ -34,13 +38,14 @@ class JobService:
         """
         Get all jobs with optional filtering.
         """
-        jobs = self.repository.get_all()
+        jobs = self.repository.get_all_shared()
 
-        # Filter by start date
+        # Parse every bound first, reporting the first invalid one, so the
+        # jobs are then filtered in a single pass
+        parsed_start = None
         if start_date:
             try:
-                parsed_start = AssignmentValidator.parse_datetime(start_date)
-                jobs = [job for job in jobs if job.startTime >= parsed_start]
+                parsed_start = parse_datetime(start_date)
             except ValueError:
                 return None, {
                     "error_type": "InvalidDateTime",
@@ -49,11 +54,10 @@ class JobService:
                     "details": {"providedValue": start_date},
                 }
 
-        # Filter by end date
+        parsed_end = None
         if end_date:
             try:
-                parsed_end = AssignmentValidator.parse_datetime(end_date)
-                jobs = [job for job in jobs if job.endTime <= parsed_end]
+                parsed_end = parse_datetime(end_date)
             except ValueError:
                 return None, {
                     "error_type": "InvalidDateTime",
@@ -62,11 +66,10 @@ class JobService:
                     "details": {"providedValue": end_date},
                 }
 
-        # Filter by minimum duration
+        min_hours = float("-inf")
         if min_duration:
             try:
                 min_hours = float(min_duration)
-                jobs = [job for job in jobs if job.get_duration_hours() >= min_hours]
             except ValueError:
                 return None, {
                     "error_type": "InvalidParameter",
@@ -75,11 +78,10 @@ class JobService:
                     "details": {"providedValue": min_duration},
                 }
 
-        # Filter by maximum duration
+        max_hours = float("inf")
         if max_duration:
             try:
                 max_hours = float(max_duration)
-                jobs = [job for job in jobs if job.get_duration_hours() <= max_hours]
             except ValueError:
                 return None, {
                     "error_type": "InvalidParameter",
@@ -88,11 +90,39 @@ class JobService:
                     "details": {"providedValue": max_duration},
                 }
 
+        by_duration = bool(min_duration or max_duration)
+        if parsed_start or parsed_end or by_duration:
+            jobs = [
+                job
+                for job in jobs
+                if (parsed_start is None or job.startTime >= parsed_start)
+                and (parsed_end is None or job.endTime <= parsed_end)
+                and (
+                    not by_duration
+                    or min_hours <= job.get_duration_hours() <= max_hours
+                )
+            ]
+        else:
+            # The shared tuple must be copied before sorting in place
+            jobs = list(jobs)
+
         # Sort by start time (most recent first)
-        jobs.sort(key=lambda j: j.startTime, reverse=True)
+        jobs.sort(key=_start_time, reverse=True)
 
         return jobs, None
 
+    def get_data_version(self) -> str:
+        """
+        Version of the job data, for conditional GETs.
+        """
+        return self.repository.version()
+
+    def dump_jobs(self, jobs: Sequence[Job]) -> List[Dict[str, Any]]:
+        """
+        Serialize jobs for a response, without re-dumping stored ones.
+        """
+        return self.repository.to_rows(jobs)
+
     def get_job_by_id(
         self, job_id: str
     ) -> Tuple[Optional[Job], Optional[Dict[str, Any]]]:
@@ -121,7 +151,7 @@ class JobService:
         if error:
             return None, error
 
-        job_data = job.model_dump()
+        job_data = {**self.repository.to_rows([job])[0]}
         job_data["durationHours"] = job.get_duration_hours()
         return job_data, None
 
@@ -129,22 +159,14 @@ class JobService:
         """
         Get jobs scheduled to start in the future.
         """
-        jobs = self.repository.get_all()
-        now = datetime.now()
-
-        # Filter for upcoming jobs
-        upcoming = [job for job in jobs if job.startTime > now]
-
-        # Sort by start time (soonest first)
-        upcoming.sort(key=lambda j: j.startTime)
-
-        return upcoming
+        # Soonest first, cut from the repository's start-time ordering
+        return self.repository.get_starting_after(datetime.now())
 
     def get_statistics(self) -> Dict[str, Any]:
         """
         Calculate job statistics and summary.
         """
-        jobs = self.repository.get_all()
+        jobs = self.repository.get_all_shared()
 
         if not jobs:
             return {
@@ -155,11 +177,12 @@ class JobService:
             }
 
         durations = [job.get_duration_hours() for job in jobs]
+        total_hours = sum(durations)
 
         return {
             "totalJobs": len(jobs),
-            "averageDurationHours": round(sum(durations) / len(durations), 2),
+            "averageDurationHours": round(total_hours / len(durations), 2),
             "shortestDurationHours": round(min(durations), 2),
             "longestDurationHours": round(max(durations), 2),
-            "totalHours": round(sum(durations), 2),
+            "totalHours": round(total_hours, 2),
         }
@@ -4,8 +4,7 @@ Enforces scheduling rules and constraints.
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Sequence, Tuple, Optional
 
 from app.models import (
     Employee,
@@ -16,6 +15,10 @@ from app.models import (
     JobBasic,
 )
 from app.repositories import EmployeeRepository, JobRepository, AssignmentRepository
+from app.services.assignment_service import AssignmentService, get_assignment_repository
+from app.services.employee_service import get_employee_repository
+from app.services.job_service import get_job_repository
+from app.utils.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
@@ -24,52 +27,14 @@ logger = logging.getLogger(__name__)
 # Repository instances
 # =============================================================================
 
-_employee_repo = EmployeeRepository()
-_job_repo = JobRepository()
-_assignment_repo = AssignmentRepository()
+# The same instances every other service uses
+_employee_repo = get_employee_repository()
+_job_repo = get_job_repository()
+_assignment_repo = get_assignment_repository()
 
-
-def get_assignment_repository() -> AssignmentRepository:
-    """Get the assignment repository instance."""
-    return _assignment_repo
-
-
-# =============================================================================
-# Time overlap helpers
-# =============================================================================
-
-
-def _parse_time(time_str: str) -> Tuple[int, int]:
-    """
-    Parse time string to hours and minutes.
-    """
-    parts = time_str.split(":")
-    return int(parts[0]), int(parts[1])
-
-
-def _time_to_minutes(time_str: str) -> int:
-    """Convert time string to total minutes since midnight."""
-    hours, minutes = _parse_time(time_str)
-    return hours * 60 + minutes
-
-
-def _times_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
-    """
-    Check if two time ranges overlap.
-    """
-    start1_min = _time_to_minutes(start1)
-    end1_min = _time_to_minutes(end1)
-    start2_min = _time_to_minutes(start2)
-    end2_min = _time_to_minutes(end2)
-
-    # Handle overnight shifts (end < start)
-    if end1_min < start1_min:
-        end1_min += 24 * 60
-    if end2_min < start2_min:
-        end2_min += 24 * 60
-
-    # Check for overlap
-    return start1_min < end2_min and start2_min < end1_min
+# Business rules live in AssignmentService; the module-level helpers below
+# delegate to it so there is a single implementation of each rule.
+_assignment_service = AssignmentService(_employee_repo, _job_repo, _assignment_repo)
 
 
 def validate_assignment(
@@ -78,91 +43,16 @@ def validate_assignment(
     """
     Validate that an assignment can be made.
     """
-    # Get employee and validate existence
-    employee = _employee_repo.get_by_id(employee_id)
-    if not employee:
-        return None, {
-            "error_type": "EmployeeNotFound",
-            "message": f"Employee with id '{employee_id}' not found",
-            "status_code": 404,
-        }
-
-    # Get job and validate existence
-    job = _job_repo.get_by_id(job_id)
-    if not job:
-        return None, {
-            "error_type": "JobNotFound",
-            "message": f"Job with id '{job_id}' not found",
-            "status_code": 404,
-        }
-
-    # Rule 3: Check employee availability
-    if not employee.availability:
-        logger.warning(f"Assignment rejected: Employee {employee.name} is unavailable")
-        return None, {
-            "error_type": "EmployeeUnavailable",
-            "message": f"Employee '{employee.name}' is currently unavailable for assignment",
-            "status_code": 400,
-        }
-
-    # Rule 1: Check for double booking (same employee-job pair already exists)
-    if _assignment_repo.exists(employee_id, job_id):
-        logger.warning(
-            f"Assignment rejected (Double Booking): "
-            f"Employee {employee.name} already assigned to job {job.name}"
-        )
-        return None, {
-            "error_type": "DoubleBooking",
-            "message": f"Employee '{employee.name}' is already assigned to '{job.name}'",
-            "status_code": 409,
-        }
-
-    # Rule 2: Check for time overlap with ALL existing assignments for this employee
-    existing_assignments = _assignment_repo.get_all_by_employee_id(employee_id)
-
-    for existing_assignment in existing_assignments:
-        existing_job = _job_repo.get_by_id(existing_assignment.jobId)
-        if existing_job and _times_overlap(
-            job.startTime, job.endTime, existing_job.startTime, existing_job.endTime
-        ):
-            logger.warning(
-                f"Assignment rejected: Time overlap for {employee.name} "
-                f"between {job.name} and {existing_job.name}"
-            )
-            return None, {
-                "error_type": "TimeOverlap",
-                "message": f"Time conflict for employee '{employee.name}': '{job.name}' overlaps with existing assignment '{existing_job.name}'",
-                "status_code": 409,
-            }
-
-    logger.info(f"Validation passed for assigning {employee.name} to {job.name}")
-    return (employee, job), None
+    return _assignment_service.validate_assignment(employee_id, job_id)
 
 
 def create_assignment(
-    employee_id: str, job_id: str, notes: Optional[str] = None
+    employee_id: str, job_id: str
 ) -> Tuple[Optional[Assignment], Optional[Dict[str, Any]]]:
     """
     Create a new assignment after validation
     """
-    # Validate the assignment
-    validation_result, error = validate_assignment(employee_id, job_id)
-    if error:
-        return None, error
-
-    employee, job = validation_result
-
-    # Create the assignment
-    new_assignment = Assignment(employeeId=employee_id, jobId=job_id, notes=notes)
-
-    # Save to data store
-    _assignment_repo.create(new_assignment)
-
-    logger.info(
-        f"Created assignment {new_assignment.id}: " f"{employee.name} -> {job.name}"
-    )
-
-    return new_assignment, None
+    return _assignment_service.create_assignment(employee_id, job_id)
 
 
 def delete_assignment(
@@ -171,39 +61,29 @@ def delete_assignment(
     """
     Delete an assignment.
     """
-    assignment = _assignment_repo.get_by_id(assignment_id)
-    if not assignment:
-        return None, {
-            "error_type": "AssignmentNotFound",
-            "message": f"Assignment with id '{assignment_id}' not found",
-            "status_code": 404,
-        }
-
-    _assignment_repo.delete(assignment_id)
-
-    logger.info(f"Deleted assignment {assignment_id}")
-    return True, None
+    return _assignment_service.delete_assignment(assignment_id)
 
 
 def get_schedule_with_details() -> List[Dict[str, Any]]:
     """
     Get schedule with employee and job details included (dict format).
-    """
-    assignments = _assignment_repo.get_all()
-    detailed_schedule = []
-
-    for assignment in assignments:
-        employee = _employee_repo.get_by_id(assignment.employeeId)
-        job = _job_repo.get_by_id(assignment.jobId)
 
-        detailed_assignment = {
-            **assignment.model_dump(mode="json"),
-            "employee": employee.model_dump(mode="json") if employee else None,
-            "job": job.model_dump(mode="json") if job else None,
+    Built from the rows each repository already holds in JSON form, so no
+    model is dumped here. The nested employee and job dicts are shared and
+    must not be modified.
+    """
+    assignments = _assignment_repo.get_all_shared()
+    employee_rows = _employee_repo.get_rows_by_ids(a.employeeId for a in assignments)
+    job_rows = _job_repo.get_rows_by_ids(a.jobId for a in assignments)
+
+    return [
+        {
+            **row,
+            "employee": employee_rows.get(assignment.employeeId),
+            "job": job_rows.get(assignment.jobId),
         }
-        detailed_schedule.append(detailed_assignment)
-
-    return detailed_schedule
+        for assignment, row in zip(assignments, _assignment_repo.to_rows(assignments))
+    ]
 
 
 class ScheduleService:
@@ -222,51 +102,72 @@ class ScheduleService:
         self.job_repo = job_repo or _job_repo
         self.assignment_repo = assignment_repo or _assignment_repo
 
+    def get_data_version(self) -> str:
+        """
+        Version of everything the enriched schedule is built from, for
+        conditional GETs.
+        """
+        return ".".join(
+            (
+                self.assignment_repo.version(),
+                self.employee_repo.version(),
+                self.job_repo.version(),
+            )
+        )
+
     def get_enriched_assignments(self) -> List[AssignmentWithDetails]:
         """
         Get all assignments with full employee and job details.
         """
-        assignments = self.assignment_repo.get_all()
-        employees = self.employee_repo.get_all()
-        jobs = self.job_repo.get_all()
-
-        enriched_assignments = []
-
-        for assignment in assignments:
-            # Find the employee
-            employee = next(
-                (emp for emp in employees if emp.id == assignment.employeeId), None
+        # Most recent first, in the order the repository maintains
+        return self._enrich(self.assignment_repo.get_all_newest_first())
+
+    def get_enriched_page(
+        self, limit: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Tuple[
+        Optional[Tuple[List[AssignmentWithDetails], Optional[str]]],
+        Optional[Dict[str, Any]],
+    ]:
+        """
+        One page of the enriched assignments, most recent first, and the
+        cursor for the next page. Only the assignments on the page are
+        enriched.
+        """
+        page, error = paginate(
+            self.assignment_repo.get_all_newest_first(), limit, cursor
+        )
+        if error:
+            return None, error
+        assignments, next_cursor = page
+        return (self._enrich(assignments), next_cursor), None
+
+    def _enrich(self, assignments: Sequence[Assignment]) -> List[AssignmentWithDetails]:
+        """Attach employee and job details to each of ``assignments``."""
+        # One projection per referenced employee and job, shared by all of
+        # their assignments (both are frozen)
+        employees = {
+            emp_id: EmployeeBasic(id=emp.id, name=emp.name, role=emp.role)
+            for emp_id, emp in self.employee_repo.get_many_by_ids(
+                a.employeeId for a in assignments
+            ).items()
+        }
+        jobs = {
+            job_id: JobBasic(
+                id=job.id, name=job.name, startTime=job.startTime, endTime=job.endTime
             )
+            for job_id, job in self.job_repo.get_many_by_ids(
+                a.jobId for a in assignments
+            ).items()
+        }
 
-            # Find the job
-            job = next((j for j in jobs if j.id == assignment.jobId), None)
-
-            # Create enriched assignment object
-            enriched = AssignmentWithDetails(
+        enriched_assignments = [
+            AssignmentWithDetails(
                 id=assignment.id,
                 assignedAt=assignment.assignedAt,
-                employee=(
-                    EmployeeBasic(
-                        id=employee.id, name=employee.name, role=employee.role
-                    )
-                    if employee
-                    else None
-                ),
-                job=(
-                    JobBasic(
-                        id=job.id,
-                        name=job.name,
-                        startTime=job.startTime,
-                        endTime=job.endTime,
-                    )
-                    if job
-                    else None
-                ),
+                employee=employees.get(assignment.employeeId),
+                job=jobs.get(assignment.jobId),
             )
-
-            enriched_assignments.append(enriched)
-
-        # Sort by assignment time (most recent first)
-        enriched_assignments.sort(key=lambda a: a.assignedAt, reverse=True)
+            for assignment in assignments
+        ]
 
         return enriched_assignments
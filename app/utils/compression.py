@@ -0,0 +1,48 @@
+"""
+gzip compression of JSON responses.
+"""
+
+import gzip
+
+from flask import Flask, Response, current_app, request
+
+
+def compress_response(response: Response) -> Response:
+    """
+    gzip a JSON response body when the client accepts it and the body is at
+    least COMPRESS_MIN_SIZE bytes long; smaller bodies are sent as they are.
+    """
+    if response.status_code == 304:
+        # A 304 must carry the Vary of the 200 it stands in for
+        response.vary.add("Accept-Encoding")
+        return response
+
+    if (
+        response.status_code < 200
+        or response.status_code == 204
+        or response.direct_passthrough
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    # A membership test would also match an explicit "gzip;q=0"; the quality
+    # lookup treats that as declined and honours "*"
+    if request.accept_encodings["gzip"] <= 0:
+        return response
+
+    body = response.get_data()
+    if len(body) < current_app.config["COMPRESS_MIN_SIZE"]:
+        return response
+
+    response.set_data(
+        gzip.compress(body, compresslevel=current_app.config["COMPRESS_LEVEL"])
+    )
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """Register response compression on the app."""
+    app.after_request(compress_response)
@@ -0,0 +1,60 @@
+"""
+orjson-backed JSON provider for Flask.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+
+def _default(o: Any) -> Any:
+    # Models are dumped with their own model_dump(), so response models keep
+    # their exclude-None behaviour when returned without dumping first
+    if isinstance(o, BaseModel):
+        return o.model_dump()
+    return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Drop-in replacement for Flask's default JSON provider.
+
+    Serialization runs in orjson, which handles datetimes, dataclasses and
+    UUIDs natively. Pydantic models are dumped via ``model_dump()``; anything
+    else falls back to ``DefaultJSONProvider.default``. The ``sort_keys`` and
+    ``compact`` settings keep their Flask meaning.
+    """
+
+    default = staticmethod(_default)
+
+    def _options(self, pretty: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON text."""
+        option = self._options(pretty=kwargs.get("indent") is not None)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON text or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the arguments straight to response bytes."""
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
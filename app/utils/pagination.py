@@ -0,0 +1,49 @@
+"""
+Cursor pagination for the list endpoints.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def paginate(
+    items: Sequence[T], limit: Optional[str] = None, cursor: Optional[str] = None
+) -> Tuple[Optional[Tuple[Sequence[T], Optional[str]]], Optional[Dict[str, Any]]]:
+    """
+    Cut one page out of ``items`` from the raw ``limit``/``cursor`` values.
+
+    ``cursor`` is the id of the last item on the previous page. Returns the
+    page and the cursor for the next one, which is None on the last page.
+    Without a limit everything after the cursor is returned.
+    """
+    page_size = None
+    if limit is not None:
+        try:
+            page_size = int(limit)
+        except ValueError:
+            page_size = 0
+        if page_size < 1:
+            return None, {
+                "error_type": "InvalidParameter",
+                "message": "limit must be a positive integer",
+                "status_code": 400,
+                "details": {"providedValue": limit},
+            }
+
+    start = 0
+    if cursor is not None:
+        start = next((i for i, item in enumerate(items) if item.id == cursor), -1) + 1
+        if not start:
+            return None, {
+                "error_type": "InvalidParameter",
+                "message": f"cursor '{cursor}' does not match any item",
+                "status_code": 400,
+                "details": {"providedValue": cursor},
+            }
+
+    if page_size is None or start + page_size >= len(items):
+        return (items[start:], None), None
+
+    page = items[start : start + page_size]
+    return (page, page[-1].id), None
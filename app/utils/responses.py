@@ -1,4 +1,65 @@
-from flask import jsonify
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from flask import Response, current_app, jsonify, request
+
+
+def json_response(payload, status_code=200) -> Response:
+    """
+    Serialize a payload into a finished JSON response.
+
+    Unlike returning ``(jsonify(...), status)`` this hands Flask a ready
+    Response, so no tuple unpacking or re-wrapping happens after the view.
+    """
+    response = current_app.json.response(payload)
+    response.status_code = status_code
+    return response
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    """
+    A bodyless 304 if the request's If-None-Match already holds ``etag``
+    (compared weakly), otherwise None.
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def _error_body(
+    error: str, message: str, details: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the dict a dumped ErrorResponse would give, without running the
+    model's validation for server-generated values.
+    """
+    body = {"success": False, "error": error, "message": message}
+    if details is not None:
+        body["details"] = details
+    body["timestamp"] = datetime.now()
+    return body
+
+
+def service_error_response(error: Dict[str, Any]) -> Response:
+    """
+    Render the error dict returned by a service method.
+    """
+    error_response = _error_body(
+        error.get("error_type", "Internal Server Error"),
+        error["message"],
+        error.get("details"),
+    )
+    return json_response(error_response, error["status_code"])
+
+
+def internal_error_response(message: str, exc: Exception) -> Response:
+    """
+    Render an unexpected exception raised while handling a request.
+    """
+    error_response = _error_body("InternalError", message, {"error": str(exc)})
+    return json_response(error_response, 500)
 
 
 def success_response(data=None, message=None, status_code=200):
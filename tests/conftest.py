@@ -0,0 +1,25 @@
+import shutil
+
+import pytest
+
+from app import create_app
+from app.config import Config, TestingConfig
+
+
+@pytest.fixture
+def app(tmp_path):
+    """An app instance working on a private copy of the data files."""
+    for source in (Config.EMPLOYEES_FILE, Config.JOBS_FILE, Config.SCHEDULE_FILE):
+        shutil.copy(source, tmp_path / source.name)
+
+    class _Config(TestingConfig):
+        EMPLOYEES_FILE = tmp_path / Config.EMPLOYEES_FILE.name
+        JOBS_FILE = tmp_path / Config.JOBS_FILE.name
+        SCHEDULE_FILE = tmp_path / Config.SCHEDULE_FILE.name
+
+    return create_app(_Config)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
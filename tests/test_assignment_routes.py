@@ -0,0 +1,90 @@
+from app.services import data_service
+
+
+def _errors(response):
+    assert response.status_code == 400
+    return [(e["field"], e["type"]) for e in response.get_json()["errors"]]
+
+
+def test_escaped_key_names_are_accepted(client):
+    response = client.post(
+        "/assign",
+        data=b'{"employee\\u0049d": "emp-001", "jobId": "job-001"}',
+        content_type="application/json",
+    )
+
+    assert response.status_code == 201
+
+
+def test_missing_field_is_reported(client):
+    response = client.post(
+        "/assign", data=b'{"jobId": "job-001"}', content_type="application/json"
+    )
+
+    assert _errors(response) == [("employeeId", "missing")]
+
+
+def test_malformed_body_is_reported_as_invalid_json(client):
+    response = client.post("/assign", data=b"{bad", content_type="application/json")
+
+    assert [kind for _, kind in _errors(response)] == ["json_invalid"]
+
+
+def _post_batch(client, pairs):
+    return client.post(
+        "/assign/batch",
+        json={"assignments": [{"employeeId": e, "jobId": j} for e, j in pairs]},
+    )
+
+
+def test_batch_checks_items_against_earlier_ones(client):
+    response = _post_batch(client, [("emp-001", "job-001"), ("emp-001", "job-001")])
+
+    assert response.status_code == 200
+    first, second = response.get_json()["data"]
+    assert first["status"] == 201
+    assert (second["status"], second["error"]) == (409, "DoubleBooking")
+
+
+def test_batch_reports_each_item(client):
+    response = _post_batch(
+        client,
+        [
+            ("emp-001", "job-001"),
+            ("emp-999", "job-001"),
+            ("emp-001", "job-002"),
+        ],
+    )
+
+    results = response.get_json()["data"]
+    assert [(r["status"], r.get("error")) for r in results] == [
+        (201, None),
+        (404, "EmployeeNotFound"),
+        (409, "TimeOverlap"),
+    ]
+    assert results[0]["data"]["employeeId"] == "emp-001"
+
+
+def test_empty_batch_is_rejected(client):
+    response = client.post("/assign/batch", json={"assignments": []})
+
+    assert _errors(response) == [("assignments", "too_short")]
+
+
+def test_batch_writes_the_schedule_once(app, client, monkeypatch):
+    written = []
+    dump = data_service._dump
+
+    def counting_dump(file_path, data, pretty):
+        written.append(file_path)
+        dump(file_path, data, pretty)
+
+    monkeypatch.setattr(data_service, "_dump", counting_dump)
+
+    response = _post_batch(
+        client,
+        [("emp-001", "job-001"), ("emp-002", "job-002"), ("emp-003", "job-003")],
+    )
+
+    assert [r["status"] for r in response.get_json()["data"]] == [201, 201, 201]
+    assert written == [app.config["SCHEDULE_FILE"]]
@@ -0,0 +1,43 @@
+import json
+import threading
+
+from app.services import AssignmentService, get_assignment_repository
+from app.services.data_service import batch
+
+
+def test_single_create_waits_for_a_running_batch(app):
+    service = AssignmentService()
+    batch_started = threading.Event()
+    finish_batch = threading.Event()
+    single_done = threading.Event()
+
+    def run_batch():
+        with app.app_context():
+            with get_assignment_repository().locked(), batch():
+                service.create_assignment("emp-001", "job-001")
+                batch_started.set()
+                finish_batch.wait(5)
+
+    def run_single():
+        with app.app_context():
+            service.create_assignment("emp-002", "job-002")
+        single_done.set()
+
+    batch_thread = threading.Thread(target=run_batch)
+    single_thread = threading.Thread(target=run_single)
+    batch_thread.start()
+    assert batch_started.wait(5)
+    single_thread.start()
+
+    # The single create blocks on the schedule file's lock until the
+    # batch has flushed
+    assert not single_done.wait(0.2)
+    finish_batch.set()
+    batch_thread.join(5)
+    single_thread.join(5)
+
+    rows = json.loads(app.config["SCHEDULE_FILE"].read_text())
+    assert {(r["employeeId"], r["jobId"]) for r in rows} == {
+        ("emp-001", "job-001"),
+        ("emp-002", "job-002"),
+    }
@@ -0,0 +1,55 @@
+import gzip
+
+import pytest
+
+
+@pytest.fixture
+def app(app):
+    # The sample employee list is a few hundred bytes; compress it
+    app.config["COMPRESS_MIN_SIZE"] = 64
+    return app
+
+
+def test_gzips_when_accepted(client):
+    response = client.get("/employees", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b'"success"' in gzip.decompress(response.data)
+
+
+def test_declined_gzip_is_not_used(client):
+    response = client.get(
+        "/employees", headers={"Accept-Encoding": "gzip;q=0, br"}
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert response.is_json
+
+
+def test_no_accept_encoding_header(client):
+    response = client.get("/employees")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.is_json
+
+
+def test_small_body_is_sent_as_is(app, client):
+    app.config["COMPRESS_MIN_SIZE"] = 1 << 20
+
+    response = client.get("/employees", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.is_json
+
+
+def test_not_modified_varies_like_the_full_response(client):
+    headers = {"Accept-Encoding": "gzip"}
+    full = client.get("/employees", headers=headers)
+
+    headers["If-None-Match"] = full.headers["ETag"]
+    not_modified = client.get("/employees", headers=headers)
+
+    assert not_modified.status_code == 304
+    assert "Content-Encoding" not in not_modified.headers
+    assert not_modified.vary == full.vary
+    assert "Accept-Encoding" in not_modified.vary
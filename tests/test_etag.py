@@ -0,0 +1,70 @@
+import json
+import os
+
+from app.services.data_service import file_version
+
+
+def test_unchanged_data_is_not_modified(client):
+    etag = client.get("/employees").headers["ETag"]
+
+    response = client.get("/employees", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_etag_changes_after_a_write(client):
+    etag = client.get("/schedule").headers["ETag"]
+
+    client.post("/assign", json={"employeeId": "emp-001", "jobId": "job-001"})
+    response = client.get("/schedule", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.get_json()["count"] == 1
+
+
+def _rename_first_employee(app, name):
+    path = app.config["EMPLOYEES_FILE"]
+    rows = json.loads(path.read_text())
+    rows[0]["name"] = name
+    path.write_text(json.dumps(rows))
+
+
+def _first_name(response):
+    return response.get_json()["data"][0]["name"]
+
+
+def test_etag_matches_the_cached_data_within_the_stat_interval(app, client):
+    app.config["DATA_STAT_INTERVAL"] = 60
+    first = client.get("/employees")
+    etag = first.headers["ETag"]
+
+    _rename_first_employee(app, "Edited Externally")
+
+    # The cached data is still served, so it must keep its own ETag
+    stale = client.get("/employees")
+    assert _first_name(stale) == _first_name(first)
+    assert stale.headers["ETag"] == etag
+
+    # Once the file is checked again, that ETag no longer matches
+    app.config["DATA_STAT_INTERVAL"] = 0
+    fresh = client.get("/employees", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert _first_name(fresh) == "Edited Externally"
+    assert fresh.headers["ETag"] != etag
+
+
+def test_version_changes_for_a_same_size_rewrite_with_the_same_mtime(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[1]")
+    stat = path.stat()
+    before = file_version(path)
+
+    replacement = tmp_path / "data.json.tmp"
+    replacement.write_text("[2]")
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, path)
+
+    assert file_version(path) != before
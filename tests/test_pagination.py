@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+def test_invalid_limit_is_rejected(client, limit):
+    response = client.get(f"/employees?limit={limit}")
+
+    assert response.status_code == 400
+    assert response.get_json()["details"] == {"providedValue": limit}
+
+
+def test_unknown_cursor_is_rejected(client):
+    response = client.get("/jobs?cursor=job-999")
+
+    assert response.status_code == 400
+    assert response.get_json()["details"] == {"providedValue": "job-999"}
+
+
+@pytest.mark.parametrize("path", ["/employees", "/jobs"])
+def test_cursors_chain_through_every_page(client, path):
+    everything = [item["id"] for item in client.get(path).get_json()["data"]]
+
+    seen = []
+    url = f"{path}?limit=2"
+    while True:
+        body = client.get(url).get_json()
+        seen.extend(item["id"] for item in body["data"])
+        if "nextCursor" not in body:
+            break
+        assert body["nextCursor"] == seen[-1]
+        url = f"{path}?limit=2&cursor={body['nextCursor']}"
+
+    assert seen == everything
+
+
+def test_full_last_page_has_no_next_cursor(client):
+    count = client.get("/employees").get_json()["count"]
+
+    body = client.get(f"/employees?limit={count}").get_json()
+
+    assert body["count"] == count
+    assert "nextCursor" not in body
+
+
+def test_schedule_pages_are_newest_first(client):
+    for employee_id, job_id in [
+        ("emp-001", "job-001"),
+        ("emp-002", "job-002"),
+        ("emp-003", "job-003"),
+    ]:
+        client.post("/assign", json={"employeeId": employee_id, "jobId": job_id})
+
+    first = client.get("/schedule?limit=2").get_json()
+    rest = client.get(f"/schedule?limit=2&cursor={first['nextCursor']}").get_json()
+
+    employees = [a["employee"]["id"] for a in first["data"] + rest["data"]]
+    assert employees == ["emp-003", "emp-002", "emp-001"]
+    assert "nextCursor" not in rest
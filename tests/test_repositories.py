@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.services import get_assignment_repository, get_employee_repository
+
+
+@pytest.fixture
+def repo(app):
+    with app.app_context():
+        yield get_employee_repository()
+
+
+def _stored(app, employee_id):
+    rows = json.loads(app.config["EMPLOYEES_FILE"].read_text())
+    return next(row for row in rows if row["id"] == employee_id)
+
+
+def test_fetched_models_cannot_be_changed_in_place(repo):
+    employee = repo.get_by_id("emp-001")
+
+    with pytest.raises(ValidationError):
+        employee.availability = False
+
+    assert repo.to_rows([employee])[0]["availability"] is True
+
+
+def test_changed_copy_is_persisted(app, repo):
+    employee = repo.get_by_id("emp-001")
+
+    repo.update(employee.as_unavailable())
+
+    assert employee.availability is True
+    assert repo.get_by_id("emp-001").availability is False
+    assert _stored(app, "emp-001")["availability"] is False
+
+    # Saving something else rewrites the file from the cached rows
+    repo.update(repo.get_by_id("emp-002").as_unavailable())
+
+    assert _stored(app, "emp-001")["availability"] is False
+    assert _stored(app, "emp-002")["availability"] is False
+
+
+def test_row_lookups_follow_updates(app, repo):
+    repo.update(repo.get_by_id("emp-001").as_unavailable())
+
+    assert repo.get_rows_by_ids(["emp-001"])["emp-001"]["availability"] is False
+
+    listed = app.test_client().get("/employees").get_json()["data"]
+    assert next(e for e in listed if e["id"] == "emp-001")["availability"] is False
+
+
+def _write_schedule(app, rows):
+    app.config["SCHEDULE_FILE"].write_text(json.dumps(rows))
+
+
+def test_duplicate_ids_resolve_to_the_first_row(app, repo):
+    _write_schedule(
+        app,
+        [
+            {
+                "id": "a-1",
+                "employeeId": "emp-001",
+                "jobId": "job-001",
+                "assignedAt": "2026-02-01T08:00:00",
+            },
+            {
+                "id": "a-1",
+                "employeeId": "emp-002",
+                "jobId": "job-002",
+                "assignedAt": "2026-02-01T09:00:00",
+            },
+        ],
+    )
+    assignments = get_assignment_repository()
+
+    assert assignments.get_by_id("a-1").employeeId == "emp-001"
+
+    assert assignments.delete("a-1")
+    assert assignments.get_by_id("a-1") is None
+    assert assignments.get_all() == []
+    assert json.loads(app.config["SCHEDULE_FILE"].read_text()) == []